@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Compila los kernels de señales a un modulo nativo (_signal_kernels).
+
+La primera llamada a un kernel @njit paga la compilacion JIT (segundos),
+lo que pesa en un proceso que arranca cada pocos minutos como cron job.
+Este script los compila por adelantado (AOT) con numba.pycc:
+
+    python build_kernels.py
+
+Genera _signal_kernels.so (.pyd en Windows) junto a este script;
+signal_generator lo importa automaticamente si existe y si no cae de
+vuelta al camino JIT.
+
+Los cuerpos de los kernels son copias de los de signal_generator.py:
+si cambias la estrategia alla, recompila aca.
+
+Requisitos:
+    pip install numba setuptools
+"""
+
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("_signal_kernels")
+
+
+@cc.export("detect_inside", "b1[:](f4[:], f4[:])")
+def detect_inside(highs, lows):
+    """Marca que barras (desde la 2) son Inside Bar respecto a la previa."""
+    n = highs.shape[0] - 2
+    out = np.empty(n, dtype=np.bool_)
+    for i in range(n):
+        out[i] = highs[i + 2] < highs[i + 1] and lows[i + 2] > lows[i + 1]
+    return out
+
+
+@cc.export(
+    "compute_levels",
+    "void(f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], f4[:], b1[:])"
+)
+def compute_levels(highs, lows, closes, entries, sls, tp1s, tp2s, tp3s, dirs):
+    """
+    Calcula entry, SL y TPs para cada barra candidata, escribiendo en los
+    arrays de salida ya asignados (el formato mas simple de exportar AOT).
+    """
+    n = highs.shape[0] - 2
+
+    for i in range(n):
+        prev_high = highs[i + 1]
+        prev_low = lows[i + 1]
+        entry = closes[i + 2]
+
+        mid = (prev_high + prev_low) * 0.5
+        bullish = entry > mid
+
+        sign = 1.0 if bullish else -1.0
+        sl_side = prev_low if bullish else prev_high
+
+        sl = sl_side - sign * 0.0005
+        risk = sign * (entry - sl)
+
+        entries[i] = entry
+        sls[i] = sl
+        tp1s[i] = entry + sign * risk
+        tp2s[i] = entry + sign * risk * 2
+        tp3s[i] = entry + sign * risk * 3
+        dirs[i] = bullish
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print("OK: _signal_kernels compilado")
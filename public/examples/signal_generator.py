@@ -4,7 +4,11 @@ Signal Generator - Ejemplo para desarrolladores externos
 Muestra como enviar señales de trading a InnovaTrading API
 
 Requisitos:
-    pip install requests
+    pip install aiohttp numpy
+
+Opcional (compilacion JIT, rate limiting, JSON mas rapido y
+payloads binarios mas chicos):
+    pip install numba aiolimiter orjson msgpack
 
 Uso:
     1. Configura tu API_KEY y API_URL
@@ -12,8 +16,67 @@ Uso:
     3. Ejecuta el script continuamente o como cron job
 """
 
-import requests
-import time
+import asyncio
+import gzip
+import aiohttp
+import numpy as np
+from dataclasses import dataclass
+
+# numba es opcional: si no esta instalado, el kernel corre como Python puro
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+# Kernels pre-compilados AOT (ver build_kernels.py): arrancan sin pagar
+# la latencia de compilacion JIT, que pesa si el proceso reinicia seguido
+try:
+    import _signal_kernels
+except ImportError:
+    _signal_kernels = None
+
+# orjson es opcional: serializa JSON (incluyendo arrays de numpy)
+# mucho mas rapido que el stdlib
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(raw: bytes):
+        return orjson.loads(raw)
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _json_loads(raw: bytes):
+        return json.loads(raw)
+
+# msgpack es opcional: formato binario 2-3x mas chico que JSON y mas
+# rapido de parsear para arrays numericos
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# aiolimiter es opcional: sin el, no se limita la tasa de requests
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    class AsyncLimiter:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
 
@@ -25,24 +88,128 @@ API_URL = "https://api.innova-trading.com"  # URL de la API
 API_KEY = "tu_api_key_aqui"                 # Tu API key
 INDICATOR_ID = "mi_indicador"               # ID unico de tu indicador
 INDICATOR_NAME = "Mi Indicador de Señales"  # Nombre visible en el chart
-SYMBOL = "EURUSD"                           # Par a analizar
+SYMBOLS = ["EURUSD"]                        # Pares a analizar (en paralelo)
 TIMEFRAME = 60                              # Timeframe en minutos (60 = H1)
+MAX_REQUESTS_PER_SECOND = 5                 # Cuota de requests a la API
+BARS_WARMUP = 500                           # Barras de la primera pasada
 
 # =============================================================================
 # FUNCIONES DE API
 # =============================================================================
 
-def get_bars(symbol: str, timeframe: int, limit: int = 500) -> Optional[List[Dict]]:
+# Limita la tasa de requests para respetar la cuota de la API
+RATE_LIMITER = AsyncLimiter(MAX_REQUESTS_PER_SECOND, 1)
+
+# Las barras se guardan en un array estructurado de numpy en vez de una
+# lista de dicts: un solo bloque contiguo en memoria, listo para los
+# kernels vectorizados. Los precios van en float32: ~7 digitos
+# significativos alcanzan para pares de 5 decimales y se mueve la mitad
+# de bytes por barra
+BARS_DTYPE = np.dtype([
+    ("time", "i8"),
+    ("open", "f4"),
+    ("high", "f4"),
+    ("low", "f4"),
+    ("close", "f4")
+])
+
+
+# Los POST solo usan msgpack despues de que el servidor demostro
+# soportarlo (respondiendo barras en msgpack); tener el paquete
+# instalado no alcanza para asumir que el servidor lo acepta
+_server_accepts_msgpack = False
+
+
+def _encode_payload(payload: Dict) -> tuple:
+    """
+    Codifica un payload saliente: msgpack si el servidor ya lo negocio,
+    si no JSON comprimido con gzip. En ambos casos viajan menos bytes
+    que con JSON plano, lo que importa cuando un tick genera miles de
+    lineas.
+
+    Returns:
+        Tuple de (body, headers)
+    """
+    if msgpack is not None and _server_accepts_msgpack:
+        return msgpack.packb(payload), {"Content-Type": "application/x-msgpack"}
+
+    return gzip.compress(_json_dumps(payload)), {
+        "Content-Type": "application/json",
+        "Content-Encoding": "gzip"
+    }
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Crea la sesion HTTP compartida con pool de conexiones.
+
+    keepalive_timeout alto para que en modo continuo las conexiones
+    sobrevivan el intervalo entre ticks y no se repita el handshake
+    TCP/TLS (1-2 RTT) en cada ciclo.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=64, keepalive_timeout=600),
+        headers={"Authorization": f"Bearer {API_KEY}"},
+        timeout=aiohttp.ClientTimeout(total=30)
+    )
+
+
+async def _request_with_retry(
+    session: aiohttp.ClientSession,
+    method: str,
+    url: str,
+    max_retries: int = 3,
+    **kwargs
+) -> Optional[aiohttp.ClientResponse]:
+    """
+    Hace un request con reintentos y back-off exponencial en 429/5xx.
+
+    Returns:
+        La respuesta (con el body ya leido) o None si hay error de conexion
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            async with RATE_LIMITER:
+                response = await session.request(method, url, **kwargs)
+            await response.read()
+
+            if response.status == 429 or response.status >= 500:
+                if attempt < max_retries:
+                    wait = 2 ** attempt
+                    print(f"HTTP {response.status}, reintentando en {wait}s...")
+                    await asyncio.sleep(wait)
+                    continue
+            return response
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            if attempt < max_retries:
+                wait = 2 ** attempt
+                print(f"Error de conexion: {e}, reintentando en {wait}s...")
+                await asyncio.sleep(wait)
+                continue
+            print(f"Error de conexion: {e}")
+            return None
+
+    return None
+
+
+async def get_bars(
+    session: aiohttp.ClientSession,
+    symbol: str,
+    timeframe: int,
+    limit: int = 500
+) -> Optional[np.ndarray]:
     """
     Obtiene datos OHLC de la API.
 
     Args:
+        session: Sesion HTTP compartida
         symbol: Par de trading (ej: "EURUSD")
         timeframe: Timeframe en minutos (1, 5, 15, 60, 240, 1440)
         limit: Cantidad de barras a obtener (max 5000)
 
     Returns:
-        Lista de barras con time, open, high, low, close, volume
+        Array estructurado (BARS_DTYPE) con time, open, high, low, close
         o None si hay error
     """
     url = f"{API_URL}/api/external/bars"
@@ -51,27 +218,44 @@ def get_bars(symbol: str, timeframe: int, limit: int = 500) -> Optional[List[Dic
         "timeframe": timeframe,
         "limit": limit
     }
-    headers = {
-        "Authorization": f"Bearer {API_KEY}"
-    }
 
-    try:
-        response = requests.get(url, params=params, headers=headers, timeout=30)
+    # Negociar msgpack cuando esta disponible; el servidor responde JSON
+    # si no lo soporta (aiohttp ya pide gzip via Accept-Encoding)
+    headers = {"Accept": "application/x-msgpack"} if msgpack is not None else None
 
-        if response.status_code == 200:
-            data = response.json()
-            return data.get("bars", [])
-        else:
-            print(f"Error obteniendo barras: {response.status_code}")
-            print(response.text)
-            return None
+    response = await _request_with_retry(
+        session, "GET", url, params=params, headers=headers
+    )
+    if response is None:
+        return None
 
-    except Exception as e:
-        print(f"Error de conexion: {e}")
+    if response.status == 200:
+        raw = await response.read()
+        if msgpack is not None and "msgpack" in response.headers.get("Content-Type", ""):
+            # El servidor respondio msgpack: a partir de aca los POST
+            # tambien pueden usarlo
+            global _server_accepts_msgpack
+            _server_accepts_msgpack = True
+            data = msgpack.unpackb(raw)
+        else:
+            data = _json_loads(raw)
+        # Directo del JSON al array estructurado, sin quedarnos con la
+        # lista de dicts intermedia
+        return np.array(
+            [
+                (b["time"], b["open"], b["high"], b["low"], b["close"])
+                for b in data.get("bars", [])
+            ],
+            dtype=BARS_DTYPE
+        )
+    else:
+        print(f"Error obteniendo barras: {response.status}")
+        print(await response.text())
         return None
 
 
-def submit_signals(
+async def submit_signals(
+    session: aiohttp.ClientSession,
     indicator_id: str,
     symbol: str,
     timeframe: int,
@@ -84,6 +268,7 @@ def submit_signals(
     Envia señales a la API.
 
     Args:
+        session: Sesion HTTP compartida
         indicator_id: ID unico de tu indicador
         symbol: Par de trading
         timeframe: Timeframe en minutos
@@ -96,10 +281,6 @@ def submit_signals(
         True si se enviaron correctamente, False si hubo error
     """
     url = f"{API_URL}/api/external/indicators/{indicator_id}"
-    headers = {
-        "Authorization": f"Bearer {API_KEY}",
-        "Content-Type": "application/json"
-    }
 
     payload = {
         "symbol": symbol,
@@ -111,265 +292,429 @@ def submit_signals(
         "metadata": metadata or {}
     }
 
-    try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+    body, headers = _encode_payload(payload)
+    response = await _request_with_retry(
+        session, "POST", url, data=body, headers=headers
+    )
+    if response is None:
+        return False
 
-        if response.status_code in [200, 201]:
-            result = response.json()
-            print(f"Señales enviadas: {result.get('points_received', 0)} puntos, {result.get('lines_received', 0)} lineas")
-            print(f"Expira: {result.get('expires_at')}")
-            return True
-        else:
-            print(f"Error enviando señales: {response.status_code}")
-            print(response.text)
-            return False
+    if response.status in [200, 201]:
+        result = await response.json()
+        print(f"Señales enviadas: {result.get('points_received', 0)} puntos, {result.get('lines_received', 0)} lineas")
+        print(f"Expira: {result.get('expires_at')}")
+        return True
+    else:
+        print(f"Error enviando señales: {response.status}")
+        print(await response.text())
+        return False
+
+
+async def submit_signals_batch(
+    session: aiohttp.ClientSession,
+    entries: List[Dict]
+) -> bool:
+    """
+    Envia los resultados de varios indicadores/simbolos en un solo POST.
+
+    Cada entry tiene la misma forma que el payload de submit_signals mas
+    su "indicator_id". Un unico request amortiza el handshake TCP/TLS y
+    permite al servidor procesar todo en una transaccion.
+
+    Si el servidor no soporta el endpoint batch (404), cae de vuelta a un
+    POST por indicador.
+
+    Args:
+        session: Sesion HTTP compartida
+        entries: Lista de dicts con indicator_id, symbol, timeframe,
+                 indicator_name, points, lines, metadata
+
+    Returns:
+        True si se enviaron correctamente, False si hubo error
+    """
+    if not entries:
+        return True
 
-    except Exception as e:
-        print(f"Error de conexion: {e}")
+    url = f"{API_URL}/api/external/indicators:batch"
+    payload = {"entries": entries}
+
+    body, headers = _encode_payload(payload)
+    response = await _request_with_retry(
+        session, "POST", url, data=body, headers=headers
+    )
+    if response is None:
         return False
 
+    if response.status in [200, 201]:
+        result = await response.json()
+        print(f"Batch enviado: {result.get('entries_received', len(entries))} indicadores")
+        return True
+
+    if response.status == 404:
+        # Servidor sin soporte batch: un POST por indicador
+        print("Endpoint batch no disponible, enviando individualmente...")
+        results = await asyncio.gather(*[
+            submit_signals(
+                session=session,
+                indicator_id=entry["indicator_id"],
+                symbol=entry["symbol"],
+                timeframe=entry["timeframe"],
+                indicator_name=entry["indicator_name"],
+                points=entry["points"],
+                lines=entry.get("lines"),
+                metadata=entry.get("metadata")
+            )
+            for entry in entries
+        ])
+        return all(results)
+
+    print(f"Error enviando batch: {response.status}")
+    print(await response.text())
+    return False
+
 
 # =============================================================================
 # TU LOGICA DE SEÑALES - Modifica esta funcion
 # =============================================================================
 
-def generate_signals(bars: List[Dict]) -> tuple:
+LINE_EXTEND_BARS = 15  # Las lineas horizontales extienden 15 barras
+
+# Plantillas definidas una sola vez a nivel de modulo: el loop caliente
+# solo agrega time/price con un dict merge (una llamada en C) en vez de
+# recrear todos los literales por señal
+BUY_POINT_TEMPLATE = {
+    "type": "low",
+    "label": "BUY",
+    "color": "#3b82f6",  # Azul
+    "shape": "arrowUp",
+    "size": 2
+}
+
+SELL_POINT_TEMPLATE = {
+    "type": "high",
+    "label": "SELL",
+    "color": "#f97316",  # Naranja
+    "shape": "arrowDown",
+    "size": 2
+}
+
+# Por tipo de linea: (sufijo de id, formato de label, color, estilo, grosor)
+# El color del entry es None porque depende de la direccion de la señal
+LINE_TEMPLATES = (
+    ("_entry", "Entry: %.5f", None, "dashed", 1),
+    ("_sl", "SL: %.5f", "#ef4444", "solid", 2),
+    ("_tp1", "TP1: %.5f", "#22c55e", "dotted", 1),
+    ("_tp2", "TP2: %.5f", "#10b981", "dotted", 1),
+    ("_tp3", "TP3: %.5f", "#059669", "dotted", 1)
+)
+
+
+@dataclass
+class LinesBatch:
+    """
+    Lineas horizontales en formato SoA: arrays paralelos en vez de una
+    lista de dicts, para evitar construir 5 dicts por señal en el loop
+    caliente.
+    """
+    ids: np.ndarray
+    prices: np.ndarray
+    start_times: np.ndarray
+    labels: np.ndarray
+    colors: np.ndarray
+    styles: np.ndarray
+    widths: np.ndarray
+
+    def to_rows(self) -> List[Dict]:
+        """Expande los arrays al formato fila por fila que espera la API."""
+        return [
+            {
+                "id": line_id,
+                "price": price,
+                "start_time": start_time,
+                "bars": LINE_EXTEND_BARS,
+                "label": label,
+                "color": color,
+                "style": style,
+                "width": width
+            }
+            for line_id, price, start_time, label, color, style, width in zip(
+                self.ids.tolist(),
+                self.prices.tolist(),
+                self.start_times.tolist(),
+                self.labels.tolist(),
+                self.colors.tolist(),
+                self.styles.tolist(),
+                self.widths.tolist()
+            )
+        ]
+
+
+def _interleave(*cols):
+    """Intercala una columna por tipo de linea: [entry, sl, tp1, tp2, tp3] x N."""
+    return np.stack(cols, axis=1).ravel()
+
+
+@njit(cache=True, fastmath=True)
+def _compute_levels_jit(highs, lows, closes):
+    """
+    Calcula entry, SL y TPs para cada barra candidata (curr = i+2, prev = i+1).
+
+    Con numba instalado este loop se compila a codigo nativo; `cache=True`
+    evita recompilar en cada ejecucion del script.
+
+    Returns:
+        Tuple de arrays (entries, sls, tp1s, tp2s, tp3s, dirs)
+        donde dirs[i] es True si la señal es alcista
+    """
+    n = highs.shape[0] - 2
+    entries = np.empty(n, dtype=np.float32)
+    sls = np.empty(n, dtype=np.float32)
+    tp1s = np.empty(n, dtype=np.float32)
+    tp2s = np.empty(n, dtype=np.float32)
+    tp3s = np.empty(n, dtype=np.float32)
+    dirs = np.empty(n, dtype=np.bool_)
+
+    for i in range(n):
+        prev_high = highs[i + 1]
+        prev_low = lows[i + 1]
+        entry = closes[i + 2]
+
+        mid = (prev_high + prev_low) * 0.5
+        bullish = entry > mid
+
+        # Una sola formula para ambas direcciones: sign resuelve el
+        # sentido y sl_side el lado de la barra previa que define el SL
+        sign = 1.0 if bullish else -1.0
+        sl_side = prev_low if bullish else prev_high
+
+        sl = sl_side - sign * 0.0005      # 5 pips mas alla del extremo
+        risk = sign * (entry - sl)
+
+        entries[i] = entry
+        sls[i] = sl
+        tp1s[i] = entry + sign * risk      # RR 1:1
+        tp2s[i] = entry + sign * risk * 2  # RR 1:2
+        tp3s[i] = entry + sign * risk * 3  # RR 1:3
+        dirs[i] = bullish
+
+    return entries, sls, tp1s, tp2s, tp3s, dirs
+
+
+def _compute_levels(highs, lows, closes):
+    """Despacha al kernel AOT si esta compilado; si no, al camino JIT."""
+    if _signal_kernels is not None:
+        n = highs.shape[0] - 2
+        entries = np.empty(n, dtype=np.float32)
+        sls = np.empty(n, dtype=np.float32)
+        tp1s = np.empty(n, dtype=np.float32)
+        tp2s = np.empty(n, dtype=np.float32)
+        tp3s = np.empty(n, dtype=np.float32)
+        dirs = np.empty(n, dtype=np.bool_)
+        _signal_kernels.compute_levels(
+            highs, lows, closes, entries, sls, tp1s, tp2s, tp3s, dirs
+        )
+        return entries, sls, tp1s, tp2s, tp3s, dirs
+
+    return _compute_levels_jit(highs, lows, closes)
+
+
+def generate_signals(bars: np.ndarray, min_time: Optional[int] = None) -> tuple:
     """
     Genera señales basadas en los datos OHLC.
 
     MODIFICA ESTA FUNCION con tu estrategia de trading.
 
     Args:
-        bars: Lista de barras con time, open, high, low, close
-              bars[0] es la mas antigua, bars[-1] es la mas reciente
+        bars: Array estructurado (BARS_DTYPE) con time, open, high, low,
+              close; bars[0] es la mas antigua, bars[-1] es la mas reciente
+        min_time: Si se indica, solo se emiten señales de barras con
+                  timestamp posterior (para el modo incremental)
 
     Returns:
         Tuple de (points, lines):
         - points: Lista de markers/flechas
         - lines: Lista de lineas horizontales para SL/TP
     """
-    points = []
-    lines = []
-    signal_count = 0
-
     # =========================================================================
     # EJEMPLO: Detectar Inside Bars y generar señal con Entry, SL, TP
     # Reemplaza esto con tu propia estrategia
     # =========================================================================
 
-    for i in range(2, len(bars)):
-        prev = bars[i - 1]
-        curr = bars[i]
+    if len(bars) < 3:
+        return [], []
 
-        # Detectar Inside Bar
-        is_inside_bar = (
-            curr["high"] < prev["high"] and
-            curr["low"] > prev["low"]
-        )
+    # Deteccion vectorizada: las columnas del array estructurado se copian
+    # a arrays contiguos y la condicion de Inside Bar se evalua sobre
+    # todas las barras de una sola vez.
+    times = np.ascontiguousarray(bars["time"])
+    highs = np.ascontiguousarray(bars["high"])
+    lows = np.ascontiguousarray(bars["low"])
+    closes = np.ascontiguousarray(bars["close"])
+
+    # curr = barra i (desde 2), prev = barra i-1
+    if _signal_kernels is not None:
+        inside = _signal_kernels.detect_inside(highs, lows)
+    else:
+        inside = (highs[2:] < highs[1:-1]) & (lows[2:] > lows[1:-1])
+
+    # Niveles (entry, SL, TPs) calculados por el kernel compilado
+    entries, sls, tp1s, tp2s, tp3s, dirs = _compute_levels(highs, lows, closes)
+
+    idx = np.flatnonzero(inside)
+    if min_time is not None:
+        # Modo incremental: las barras ya procesadas en ticks anteriores
+        # no se vuelven a emitir
+        idx = idx[times[idx + 2] > min_time]
+    if idx.size == 0:
+        return [], []
+
+    # Puntos de entrada (flechas): la cantidad de señales ya se conoce,
+    # asi que la lista se asigna una sola vez con el tamaño exacto
+    points = [None] * idx.size
+    for j, k in enumerate(idx):
+        bar_time = int(times[k + 2])  # IMPORTANTE: usar el timestamp real
+        entry_price = float(entries[k])
+
+        template = BUY_POINT_TEMPLATE if dirs[k] else SELL_POINT_TEMPLATE
+        points[j] = {**template, "time": bar_time, "price": entry_price}
+
+    # Lineas horizontales en formato SoA: 5 lineas por señal (entry, SL,
+    # TP1-3) construidas como columnas segun LINE_TEMPLATES; los labels
+    # se formatean en una sola pasada vectorizada en vez de 5 f-strings
+    # por señal
+    m = idx.size
+    sel_times = times[idx + 2]
+    sel_dirs = dirs[idx]
+    # El id se deriva del timestamp de la barra: estable entre ticks,
+    # para que al acumular señales en modo incremental una misma barra
+    # se pueda dedupear por timestamp
+    sig_ids = np.char.mod("signal_%d", sel_times)
+
+    level_cols = (entries[idx], sls[idx], tp1s[idx], tp2s[idx], tp3s[idx])
+    entry_colors = np.where(
+        sel_dirs, BUY_POINT_TEMPLATE["color"], SELL_POINT_TEMPLATE["color"]
+    )
 
-        if not is_inside_bar:
-            continue
-
-        # Determinar direccion basada en cierre
-        mid_point = (prev["high"] + prev["low"]) / 2
-        is_bullish = curr["close"] > mid_point
-
-        # Calcular niveles
-        bar_time = curr["time"]  # IMPORTANTE: usar el timestamp real
-        entry_price = curr["close"]
-
-        signal_id = f"signal_{signal_count:03d}"
-        signal_count += 1
-
-        if is_bullish:
-            # Señal de COMPRA
-            stop_loss = prev["low"] - 0.0005  # 5 pips debajo
-            tp1 = entry_price + (entry_price - stop_loss) * 1  # RR 1:1
-            tp2 = entry_price + (entry_price - stop_loss) * 2  # RR 1:2
-            tp3 = entry_price + (entry_price - stop_loss) * 3  # RR 1:3
-
-            # Entry point (flecha)
-            points.append({
-                "time": bar_time,
-                "type": "low",
-                "price": entry_price,
-                "label": "BUY",
-                "color": "#3b82f6",  # Azul
-                "shape": "arrowUp",
-                "size": 2
-            })
-
-            # LINEAS HORIZONTALES (extienden 15 barras)
-            lines.append({
-                "id": f"{signal_id}_entry",
-                "price": entry_price,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"Entry: {entry_price:.5f}",
-                "color": "#3b82f6",
-                "style": "dashed",
-                "width": 1
-            })
-
-            lines.append({
-                "id": f"{signal_id}_sl",
-                "price": stop_loss,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"SL: {stop_loss:.5f}",
-                "color": "#ef4444",
-                "style": "solid",
-                "width": 2
-            })
-
-            lines.append({
-                "id": f"{signal_id}_tp1",
-                "price": tp1,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"TP1: {tp1:.5f}",
-                "color": "#22c55e",
-                "style": "dotted",
-                "width": 1
-            })
-
-            lines.append({
-                "id": f"{signal_id}_tp2",
-                "price": tp2,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"TP2: {tp2:.5f}",
-                "color": "#10b981",
-                "style": "dotted",
-                "width": 1
-            })
-
-            lines.append({
-                "id": f"{signal_id}_tp3",
-                "price": tp3,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"TP3: {tp3:.5f}",
-                "color": "#059669",
-                "style": "dotted",
-                "width": 1
-            })
+    lines_batch = LinesBatch(
+        ids=_interleave(*[
+            np.char.add(sig_ids, suffix)
+            for suffix, _, _, _, _ in LINE_TEMPLATES
+        ]),
+        prices=_interleave(*level_cols),
+        start_times=_interleave(*(sel_times,) * len(LINE_TEMPLATES)),
+        labels=_interleave(*[
+            np.char.mod(fmt, col)
+            for (_, fmt, _, _, _), col in zip(LINE_TEMPLATES, level_cols)
+        ]),
+        colors=_interleave(*[
+            entry_colors if color is None else np.full(m, color)
+            for _, _, color, _, _ in LINE_TEMPLATES
+        ]),
+        styles=_interleave(*[
+            np.full(m, style) for _, _, _, style, _ in LINE_TEMPLATES
+        ]),
+        widths=_interleave(*[
+            np.full(m, width) for _, _, _, _, width in LINE_TEMPLATES
+        ])
+    )
 
-        else:
-            # Señal de VENTA
-            stop_loss = prev["high"] + 0.0005  # 5 pips arriba
-            tp1 = entry_price - (stop_loss - entry_price) * 1
-            tp2 = entry_price - (stop_loss - entry_price) * 2
-            tp3 = entry_price - (stop_loss - entry_price) * 3
-
-            # Entry point (flecha)
-            points.append({
-                "time": bar_time,
-                "type": "high",
-                "price": entry_price,
-                "label": "SELL",
-                "color": "#f97316",  # Naranja
-                "shape": "arrowDown",
-                "size": 2
-            })
-
-            # LINEAS HORIZONTALES
-            lines.append({
-                "id": f"{signal_id}_entry",
-                "price": entry_price,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"Entry: {entry_price:.5f}",
-                "color": "#f97316",
-                "style": "dashed",
-                "width": 1
-            })
-
-            lines.append({
-                "id": f"{signal_id}_sl",
-                "price": stop_loss,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"SL: {stop_loss:.5f}",
-                "color": "#ef4444",
-                "style": "solid",
-                "width": 2
-            })
-
-            lines.append({
-                "id": f"{signal_id}_tp1",
-                "price": tp1,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"TP1: {tp1:.5f}",
-                "color": "#22c55e",
-                "style": "dotted",
-                "width": 1
-            })
-
-            lines.append({
-                "id": f"{signal_id}_tp2",
-                "price": tp2,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"TP2: {tp2:.5f}",
-                "color": "#10b981",
-                "style": "dotted",
-                "width": 1
-            })
-
-            lines.append({
-                "id": f"{signal_id}_tp3",
-                "price": tp3,
-                "start_time": bar_time,
-                "bars": 15,
-                "label": f"TP3: {tp3:.5f}",
-                "color": "#059669",
-                "style": "dotted",
-                "width": 1
-            })
-
-    return points, lines
+    return points, lines_batch.to_rows()
 
 
 # =============================================================================
 # EJECUCION PRINCIPAL
 # =============================================================================
 
-def run_once():
-    """Ejecuta el generador de señales una vez."""
-    print("=" * 60)
-    print(f"Signal Generator - {datetime.now(timezone.utc).isoformat()}")
-    print(f"Symbol: {SYMBOL} | Timeframe: {TIMEFRAME}m")
-    print("=" * 60)
+# Estado incremental por simbolo (modo continuo): en cada tick solo se
+# piden y escanean las barras nuevas, pero como la API reemplaza el
+# estado del indicador en cada POST (y lo expira a las 24h si no se
+# reenvia), las señales acumuladas se reenvian completas en cada tick.
+# _LAST_BAR_TIME marca la ultima barra CERRADA ya procesada.
+_LAST_BAR_TIME: Dict[str, int] = {}
+_POINTS_CACHE: Dict[str, List[Dict]] = {}
+_LINES_CACHE: Dict[str, List[Dict]] = {}
+
+# Estado calculado durante el tick en curso; se confirma recien cuando
+# el POST sale bien, asi un envio fallido se reintenta entero en el
+# proximo tick en vez de perderse
+_PENDING_STATE: Dict[str, tuple] = {}
+
 
+async def process_symbol(session: aiohttp.ClientSession, symbol: str) -> Optional[Dict]:
+    """
+    Obtiene datos y genera señales para un simbolo.
+
+    Returns:
+        Entry listo para submit_signals_batch, {} si no hay señales,
+        o None si hubo error
+    """
     # 1. Obtener datos
-    print("\n1. Obteniendo datos OHLC...")
-    bars = get_bars(SYMBOL, TIMEFRAME, limit=500)
+    # La primera pasada trae el historial completo; despues solo pueden
+    # aparecer señales en las barras nuevas, asi que la ventana se achica
+    # a las barras transcurridas desde el ultimo tick (+2 de contexto)
+    last_time = _LAST_BAR_TIME.get(symbol)
+    if last_time is None:
+        limit = BARS_WARMUP
+    else:
+        elapsed = int(datetime.now(timezone.utc).timestamp()) - last_time
+        limit = max(3, elapsed // (TIMEFRAME * 60) + 2)
 
-    if not bars:
-        print("   ERROR: No se pudieron obtener los datos")
-        return False
+    print(f"[{symbol}] Obteniendo datos OHLC...")
+    bars = await get_bars(session, symbol, TIMEFRAME, limit=limit)
+
+    if bars is None or len(bars) == 0:
+        print(f"[{symbol}] ERROR: No se pudieron obtener los datos")
+        return None
+
+    print(f"[{symbol}] OK: {len(bars)} barras obtenidas")
+
+    # 2. Generar señales nuevas y sumarlas a las acumuladas. Las barras
+    # posteriores al watermark se rederivan completas en cada tick, asi
+    # que del cache solo se conserva lo ya confirmado (<= last_time) y
+    # el escaneo fresco lo reemplaza: una señal provisoria de la barra
+    # en formacion se actualiza con el cierre definitivo, o desaparece
+    # si la barra dejo de ser Inside Bar
+    new_points, new_lines = generate_signals(bars, min_time=last_time)
+    if last_time is None:
+        points = new_points
+        lines = new_lines
+    else:
+        points = [
+            p for p in _POINTS_CACHE.get(symbol, []) if p["time"] <= last_time
+        ] + new_points
+        lines = [
+            l for l in _LINES_CACHE.get(symbol, []) if l["start_time"] <= last_time
+        ] + new_lines
+
+    # El watermark solo avanza hasta la anteultima barra (la ultima
+    # puede seguir formandose) y se confirma en run_once tras el envio
+    if len(bars) >= 2:
+        watermark = int(bars["time"][-2])
+    else:
+        watermark = last_time
 
-    print(f"   OK: {len(bars)} barras obtenidas")
+    # Acotar el estado reenviado a la misma ventana visible que la
+    # primera pasada: señales mas viejas que BARS_WARMUP barras se podan
+    # para que el payload por tick no crezca sin limite
+    if watermark is not None:
+        cutoff = watermark - BARS_WARMUP * TIMEFRAME * 60
+        points = [p for p in points if p["time"] > cutoff]
+        lines = [l for l in lines if l["start_time"] > cutoff]
 
-    # 2. Generar señales
-    print("\n2. Generando señales...")
-    points, lines = generate_signals(bars)
-    print(f"   OK: {len(points)} puntos, {len(lines)} lineas generadas")
+    _PENDING_STATE[symbol] = (watermark, points, lines)
+
+    print(f"[{symbol}] OK: {len(new_points)} puntos nuevos, {len(points)} acumulados")
 
     if not points and not lines:
-        print("   No hay señales para enviar")
-        return True
+        print(f"[{symbol}] No hay señales para enviar")
+        return {}
 
-    # 3. Contar tipos de señales
-    buy_signals = len([s for s in points if s.get("label") == "BUY"])
-    sell_signals = len([s for s in points if s.get("label") == "SELL"])
-    print(f"   - BUY: {buy_signals}")
-    print(f"   - SELL: {sell_signals}")
+    # 3. Contar tipos de señales (una sola pasada, sin listas temporales)
+    buy_signals = sum(1 for s in points if s.get("label") == "BUY")
+    sell_signals = len(points) - buy_signals
+    print(f"[{symbol}] BUY: {buy_signals} | SELL: {sell_signals}")
 
-    # 4. Enviar a la API
-    print("\n3. Enviando señales a la API...")
+    # 4. Armar el entry para el batch
     metadata = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "total_points": len(points),
@@ -379,16 +724,54 @@ def run_once():
         "strategy": "Inside Bar with Multi-TP + Lines"
     }
 
-    success = submit_signals(
-        indicator_id=INDICATOR_ID,
-        symbol=SYMBOL,
-        timeframe=TIMEFRAME,
-        indicator_name=INDICATOR_NAME,
-        points=points,
-        lines=lines,
-        metadata=metadata
+    return {
+        "indicator_id": INDICATOR_ID,
+        "symbol": symbol,
+        "timeframe": TIMEFRAME,
+        "indicator_name": INDICATOR_NAME,
+        "version": "1.0",
+        "points": points,
+        "lines": lines,
+        "metadata": metadata
+    }
+
+
+async def run_once(session: Optional[aiohttp.ClientSession] = None) -> bool:
+    """
+    Ejecuta el generador de señales una vez (todos los simbolos en paralelo).
+
+    Args:
+        session: Sesion HTTP a reutilizar; si es None se crea una propia
+    """
+    if session is None:
+        async with create_session() as own_session:
+            return await run_once(own_session)
+
+    print("=" * 60)
+    print(f"Signal Generator - {datetime.now(timezone.utc).isoformat()}")
+    print(f"Symbols: {', '.join(SYMBOLS)} | Timeframe: {TIMEFRAME}m")
+    print("=" * 60)
+
+    # Los simbolos se procesan concurrentemente y los resultados se
+    # acumulan para enviarse en un solo POST batch
+    results = await asyncio.gather(
+        *[process_symbol(session, symbol) for symbol in SYMBOLS]
     )
 
+    entries = [entry for entry in results if entry]
+    submitted = await submit_signals_batch(session, entries)
+
+    # El estado incremental se confirma solo si el envio salio bien;
+    # si fallo, el proximo tick vuelve a escanear y reenviar lo mismo
+    if submitted:
+        for symbol, (watermark, points, lines) in _PENDING_STATE.items():
+            if watermark is not None:
+                _LAST_BAR_TIME[symbol] = watermark
+            _POINTS_CACHE[symbol] = points
+            _LINES_CACHE[symbol] = lines
+    _PENDING_STATE.clear()
+
+    success = submitted and all(entry is not None for entry in results)
     if success:
         print("\n" + "=" * 60)
         print("EXITO! Señales enviadas correctamente.")
@@ -398,7 +781,7 @@ def run_once():
     return success
 
 
-def run_continuous(interval_seconds: int = 300):
+async def run_continuous(interval_seconds: int = 300):
     """
     Ejecuta el generador de señales continuamente.
 
@@ -408,27 +791,31 @@ def run_continuous(interval_seconds: int = 300):
     print(f"Iniciando modo continuo (cada {interval_seconds} segundos)")
     print("Presiona Ctrl+C para detener\n")
 
-    while True:
-        try:
-            run_once()
-            print(f"\nProxima ejecucion en {interval_seconds} segundos...\n")
-            time.sleep(interval_seconds)
-        except KeyboardInterrupt:
-            print("\n\nDetenido por el usuario")
-            break
-        except Exception as e:
-            print(f"\nError: {e}")
-            print(f"Reintentando en {interval_seconds} segundos...\n")
-            time.sleep(interval_seconds)
+    # Una sola sesion para todo el modo continuo: las conexiones
+    # keep-alive se reutilizan entre ticks en vez de renegociar
+    # TCP/TLS en cada ciclo
+    async with create_session() as session:
+        while True:
+            try:
+                await run_once(session)
+                print(f"\nProxima ejecucion en {interval_seconds} segundos...\n")
+                await asyncio.sleep(interval_seconds)
+            except Exception as e:
+                print(f"\nError: {e}")
+                print(f"Reintentando en {interval_seconds} segundos...\n")
+                await asyncio.sleep(interval_seconds)
 
 
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--continuous":
-        # Modo continuo: python signal_generator.py --continuous
-        interval = int(sys.argv[2]) if len(sys.argv) > 2 else 300
-        run_continuous(interval)
-    else:
-        # Modo unico: python signal_generator.py
-        run_once()
+    try:
+        if len(sys.argv) > 1 and sys.argv[1] == "--continuous":
+            # Modo continuo: python signal_generator.py --continuous
+            interval = int(sys.argv[2]) if len(sys.argv) > 2 else 300
+            asyncio.run(run_continuous(interval))
+        else:
+            # Modo unico: python signal_generator.py
+            asyncio.run(run_once())
+    except KeyboardInterrupt:
+        print("\n\nDetenido por el usuario")